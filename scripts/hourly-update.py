@@ -1,6 +1,6 @@
 """
 Hourly task:
-• read today's top-10 snapshot
+• read today's top-10 snapshot (created from a cached market lookup if missing)
 • recompute their average abs price change since 00:00 ET (fidelity 60 min)
 • write / overwrite today's value in data/daily_scores.json
 """
@@ -10,11 +10,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from scraper import scrape_markets, get_ois, get_day_price_change
+from scraper import scrape_markets, get_ois, get_top_active_ois, get_day_price_change
 
 ET = ZoneInfo("America/New_York")
 TOP10_DIR   = Path("data/top10")
 SCORES_FILE = Path("data/daily_scores.json")
+MARKETS_CACHE = Path("data/markets_cache.json")
 
 def main() -> None:
     now_et   = datetime.now(ET)
@@ -26,20 +27,31 @@ def main() -> None:
     snapshot_file = TOP10_DIR / f"{day_str}.json"
     if not snapshot_file.exists():
         print(f"⚠️  No top-10 snapshot yet for {day_str}, creating it now...")
-        # --- replicate daily_top10.py logic ---
-        markets = scrape_markets(active=True)
-        top_oi  = get_ois(markets, unix_timestamp=today_ts, top_n=10)
-        markets_by_id = {m["conditionId"]: m for m in markets}
-        snapshot = []
-        for m in top_oi:
-            cond = m["id"]
-            src  = markets_by_id.get(cond, {})
-            snapshot.append({
-                "conditionId": cond,
-                "tokenId":    src.get("tokenId"),
-                "question":   src.get("question"),
+        # fast path: rank OI, look up only the candidate markets
+        snapshot = [
+            {
+                "conditionId":  m["id"],
+                "tokenId":      m["market"].get("tokenId"),
+                "question":     m["market"].get("question"),
                 "openInterest": m["amount"],
-            })
+            }
+            for m in get_top_active_ois(today_ts, top_n=10, cache_path=MARKETS_CACHE)
+        ]
+        if not snapshot:
+            # --- replicate daily_top10.py logic ---
+            print("⚠️  Targeted lookup failed, scraping all active markets...")
+            markets = scrape_markets(active=True)
+            top_oi  = get_ois(markets, unix_timestamp=today_ts, top_n=10)
+            markets_by_id = {m["conditionId"]: m for m in markets}
+            for m in top_oi:
+                cond = m["id"]
+                src  = markets_by_id.get(cond, {})
+                snapshot.append({
+                    "conditionId": cond,
+                    "tokenId":    src.get("tokenId"),
+                    "question":   src.get("question"),
+                    "openInterest": m["amount"],
+                })
         TOP10_DIR.mkdir(parents=True, exist_ok=True)
         snapshot_file.write_text(json.dumps(snapshot, indent=2))
         print(f"✅ Created top-10 → {snapshot_file}")
@@ -21,6 +21,34 @@ API_OI_GQL  = (
 )
 
 
+# ───────────────────────── _slim_market ─────────────────────────────────────
+def _slim_market(m: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a raw Gamma market to the fields we keep."""
+    rec: dict[str, Any] = {
+        "conditionId": m.get("conditionId"),
+        "question":    m.get("question"),
+    }
+
+    # Add slug if present
+    if slug := m.get("slug"):
+        rec["slug"] = slug
+
+    # timestamps
+    for fld in ("createdAt", "closedTime"):
+        if cleaned := clean_timestamp(m.get(fld)):
+            rec[fld] = cleaned
+
+    # tokenId
+    if tok := get_yes_token_id(m.get("clobTokenIds", "")):
+        rec["tokenId"] = tok
+
+    # events
+    if ev := m.get("events"):
+        rec["event_ids"] = [e["id"] for e in ev if e.get("id")]
+
+    return rec
+
+
 # ───────────────────────── scrape_markets ───────────────────────────────────
 def scrape_markets(
     active: bool = True,
@@ -54,29 +82,7 @@ def scrape_markets(
     # --- post-process --------------------------------------------------------
     slim: list[dict[str, Any]] = []
     for m in markets:
-        rec: dict[str, Any] = {
-            "conditionId": m.get("conditionId"),
-            "question":    m.get("question"),
-        }
-
-        # Add slug if present
-        if slug := m.get("slug"):
-            rec["slug"] = slug
-
-        # timestamps
-        for fld in ("createdAt", "closedTime"):
-            if cleaned := clean_timestamp(m.get(fld)):
-                rec[fld] = cleaned
-
-        # tokenId
-        if tok := get_yes_token_id(m.get("clobTokenIds", "")):
-            rec["tokenId"] = tok
-
-        # events
-        if ev := m.get("events"):
-            rec["event_ids"] = [e["id"] for e in ev if e.get("id")]
-
-        if any(rec.values()):
+        if any((rec := _slim_market(m)).values()):
             slim.append(rec)
 
     if output_path:
@@ -144,9 +150,11 @@ def get_ois(
     markets: Optional[List[Dict[str, Any]]] = None,
     unix_timestamp: Optional[int] = None,
     top_n: Optional[int] = None,
+    skip: int = 0,
 ) -> List[Dict[str, Any]]:
     """
-    Return top-N markets by open interest (GraphQL call).
+    Return top-N markets by open interest (GraphQL call), starting *skip*
+    rows down the ranking.
     """
     def fetch_batch(batch_size: int = 100, skip: int = 0) -> List[Dict[str, Any]]:
         variables: Dict[str, Any] = {}
@@ -205,7 +213,6 @@ def get_ois(
 
     batch_size = max(top_n or 100, 100)
     result: list[dict[str, Any]] = []
-    skip = 0
 
     while True:
         batch = fetch_batch(batch_size, skip)
@@ -223,6 +230,138 @@ def get_ois(
     return result[:top_n] if top_n else result
 
 
+# ─────────────────────────── fetch_markets ──────────────────────────────────
+def fetch_markets(
+    condition_ids: List[str],
+    chunk_size: int = 50,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Hit Polymarket REST for just *condition_ids* (open or closed) and return
+    the slim list with a 'closed' flag, or None if any request fails.
+    """
+    slim: list[dict[str, Any]] = []
+    sess = requests.Session()
+
+    for i in range(0, len(condition_ids), chunk_size):
+        chunk = condition_ids[i:i + chunk_size]
+        params = {"condition_ids": chunk, "limit": len(chunk)}
+        try:
+            res = sess.get(API_MARKETS, params=params, timeout=20)
+            res.raise_for_status()
+        except Exception as exc:
+            print("❌ Fetch error:", exc)
+            return None
+
+        for m in res.json():
+            if m.get("conditionId") in chunk:
+                rec = _slim_market(m)
+                rec["closed"] = bool(m.get("closed"))
+                slim.append(rec)
+
+    return slim
+
+
+# ──────────────────────── get_top_active_ois ────────────────────────────────
+CLOSED_RECHECK_AGE = 7 * 24 * 60 * 60    # seconds before a closed market is re-checked
+MARKET_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # seconds before an unchecked entry is pruned
+
+
+def _load_market_cache(path: Optional[Path]) -> Dict[str, Any]:
+    cache: dict[str, Any] = {"markets": {}}
+    if path and path.exists():
+        try:
+            cache.update(json.loads(path.read_text()))
+        except (json.JSONDecodeError, OSError) as exc:
+            print(f"⚠️  Ignoring unreadable market cache {path}: {exc}")
+    return cache
+
+
+def get_top_active_ois(
+    unix_timestamp: Optional[int] = None,
+    top_n: int = 10,
+    cache_path: Optional[str | os.PathLike[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Return top-N *active* markets by open interest without scraping the whole
+    catalog.
+
+    Walks the global OI ranking and resolves those conditionIds through a
+    local market cache (*cache_path*). tokenId/question/event_ids are kept
+    indefinitely; only status is refreshed: open markets on every call,
+    closed ones after CLOSED_RECHECK_AGE. Entries not checked for
+    MARKET_CACHE_MAX_AGE are pruned.
+    Rows look like get_ois() plus a 'market' slim record; [] on failure or
+    if fewer than *top_n* active markets were found.
+    """
+    path = Path(cache_path) if cache_path else None
+    cache: dict[str, dict[str, Any]] = _load_market_cache(path)["markets"]
+    now = int(time.time())
+
+    def is_fresh(cid: str) -> bool:
+        rec = cache.get(cid)
+        return bool(rec and rec.get("closed") and now - rec.get("checkedAt", 0) < CLOSED_RECHECK_AGE)
+
+    batch_size = 100
+    lookup_size = 2 * top_n
+    seen_events: Set[str] = set()
+    result: list[dict[str, Any]] = []
+    skip = 0
+
+    while len(result) < top_n:
+        batch = get_ois(unix_timestamp=unix_timestamp, top_n=batch_size, skip=skip)
+        if not batch:
+            break
+
+        # resolve in small slices so lookups stop once top_n is reached
+        for start in range(0, len(batch), lookup_size):
+            rows = batch[start:start + lookup_size]
+            stale = [r["id"] for r in rows if not is_fresh(r["id"])]
+            checked: Set[str] = set()
+            if stale:
+                print(f"🔄 Looking up {len(stale)} markets…")
+                fetched = fetch_markets(stale)
+                if fetched is None:
+                    return []
+                for rec in fetched:
+                    cache[rec["conditionId"]] = {**rec, "checkedAt": now}
+                    checked.add(rec["conditionId"])
+                if unknown := [cid for cid in stale if cid not in checked]:
+                    print(f"⚠️  Gamma returned no record for {len(unknown)} markets, skipping them")
+
+            for r in rows:
+                m = cache.get(r["id"])
+                if not m or m.get("closed") or (r["id"] in stale and r["id"] not in checked):
+                    continue
+                ev = m.get("event_ids", [])
+                if ev and any(e in seen_events for e in ev):
+                    continue
+                seen_events.update(ev)
+                market = {k: v for k, v in m.items() if k not in ("closed", "checkedAt")}
+                result.append({**r, "market": market})
+                if len(result) >= top_n:
+                    break
+            if len(result) >= top_n:
+                break
+
+        if len(batch) < batch_size:
+            break
+        skip += batch_size
+
+    if path:
+        kept = {
+            cid: rec for cid, rec in cache.items()
+            if now - rec.get("checkedAt", 0) < MARKET_CACHE_MAX_AGE
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"markets": kept}, indent=2, ensure_ascii=False))
+
+    if len(result) < top_n:
+        print(f"⚠️  Only {len(result)}/{top_n} active markets resolved from OI ranking")
+        return []
+
+    return result
+
+
 # ──────────────────────── get_day_price_change ──────────────────────────────
 def get_day_price_change(
     token_id: str,